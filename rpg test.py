@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import pygame
 import sys
+import os
+import json
 import random
 import math
 
@@ -69,12 +71,23 @@ class Character:
         self.alive   = True
         self.pos     = (0, 0)   # Screen position (top-left)
         self.sprite  = None     # Pygame Surface for the sprite
+        self.status_effects = {}    # Active StatusEffect objects keyed by effect name
+        self.stat_modifiers = {}    # Cached stat multipliers from status effects
+        self.stunned = False
+
+    def get_stat(self, stat):
+        """Return a stat with any status-effect modifiers applied."""
+        return getattr(self, stat) * self.stat_modifiers.get(stat, 1.0)
 
     def take_damage(self, dmg):
         self.hp -= dmg
         if self.hp <= 0:
             self.hp = 0
             self.alive = False
+            # Status effects end on death; their pending wheel entries are skipped as stale.
+            self.status_effects = {}
+            self.stat_modifiers = {}
+            self.stunned = False
 
     def heal(self, amount):
         self.hp += amount
@@ -102,8 +115,8 @@ class Boss(Character):
         super().__init__("Final Boss", 300, 30, 20, 20, 15)
 
 def calculate_damage(attacker, target, multiplier=1.0, is_magic=False):
-    stat = attacker.magic if is_magic else attacker.attack
-    base = stat * multiplier - target.defense
+    stat = attacker.get_stat("magic") if is_magic else attacker.get_stat("attack")
+    base = stat * multiplier - target.get_stat("defense")
     base = max(1, base)
     return int(base * random.uniform(0.85, 1.15))
 
@@ -180,27 +193,34 @@ def generate_boss_sprite(size):
 # ---------------------------
 # Moves Data & Action Class
 # ---------------------------
-moves_data = {
-    "Warrior": [
-        {"name": "Strike",       "type": "physical", "multiplier": 1.0, "hit_chance": 1.0},
-        {"name": "Heavy Slash",  "type": "physical", "multiplier": 1.5, "hit_chance": 0.75}
-    ],
-    "Mage": [
-        {"name": "Magic Missile", "type": "magical",  "multiplier": 1.0, "hit_chance": 1.0},
-        {"name": "Fireball",      "type": "magical",  "multiplier": 1.5, "hit_chance": 1.0}
-    ],
-    "Healer": [
-        {"name": "Attack",        "type": "physical", "multiplier": 1.0, "hit_chance": 1.0},
-        {"name": "Heal",          "type": "heal",     "multiplier": 1.5, "hit_chance": 1.0}
-    ],
-    "Thief": [
-        {"name": "Quick Strike",  "type": "physical", "multiplier": 1.0, "hit_chance": 1.0},
-        {"name": "Backstab",      "type": "physical", "multiplier": 2.0, "hit_chance": 0.60}
-    ]
-}
+# Move definitions live in a JSON file next to this script so they can be
+# edited (and hot reloaded) while the game is running.
+MOVES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "moves.json")
+MOVES_POLL_INTERVAL = 500  # milliseconds between checks for an edited moves file
+MOVE_TYPES = ("physical", "magical", "heal")
+MOVE_NUMBER_FIELDS = ("multiplier", "hit_chance", "effect_chance", "duration")
+
+class Move:
+    """A compiled move definition. IDs are stable across hot reloads."""
+    __slots__ = ("id", "name", "owner", "type", "is_magic", "is_heal", "multiplier",
+                 "hit_chance", "effect", "effect_chance", "animation", "duration")
+
+    def __init__(self, move_id, owner, data):
+        self.id            = move_id
+        self.owner         = owner
+        self.name          = data["name"]
+        self.type          = data["type"]
+        self.is_magic      = self.type == "magical"
+        self.is_heal       = self.type == "heal"
+        self.multiplier    = float(data["multiplier"])
+        self.hit_chance    = float(data["hit_chance"])
+        self.effect        = data.get("effect")
+        self.effect_chance = float(data.get("effect_chance", 1.0))
+        self.animation     = data.get("animation")
+        self.duration      = int(data.get("duration", 500))
 
 class Action:
-    def __init__(self, attacker, target, move_name, damage, move_type, is_heal=False, hit=True):
+    def __init__(self, attacker, target, move_name, damage, move_type, is_heal=False, hit=True, effect=None, move_id=None):
         self.attacker  = attacker
         self.target    = target
         self.move_name = move_name
@@ -208,6 +228,158 @@ class Action:
         self.move_type = move_type   # "physical", "magical", or "heal"
         self.is_heal   = is_heal
         self.hit       = hit
+        self.effect    = effect      # Name of the status effect applied on hit, if any
+        self.move_id   = move_id     # Move.id used to dispatch the animation
+
+def roll_effect(move):
+    """Return the move's status effect name if its effect_chance roll succeeds."""
+    if move.effect and random.random() <= move.effect_chance:
+        return move.effect
+    return None
+
+# ---------------------------
+# Status Effects
+# ---------------------------
+# Durations are in rounds. "stacking" is one of:
+#   "refresh" - reapplying resets the duration
+#   "stack"   - reapplying adds a stack (up to max_stacks) and resets the duration
+#   "ignore"  - reapplying has no effect while the effect is active
+# Effects with "target": "self" land on the attacker instead of the move's target.
+status_effects_data = {
+    "Focus":  {"kind": "buff",   "duration": 3, "stacking": "stack", "max_stacks": 2, "stat": "attack",  "multiplier": 1.2, "target": "self"},
+    "Regen":  {"kind": "buff",   "duration": 3, "stacking": "refresh", "tick_heal": 10},
+    "Stun":   {"kind": "debuff", "duration": 2, "stacking": "ignore", "stun": True},
+    "Scorch": {"kind": "debuff", "duration": 2, "stacking": "refresh", "stat": "defense", "multiplier": 0.7},
+    "Slow":   {"kind": "debuff", "duration": 2, "stacking": "refresh", "stat": "speed",   "multiplier": 0.5},
+    "Poison": {"kind": "debuff", "duration": 3, "stacking": "stack", "max_stacks": 3, "tick_damage": 6},
+    "Weaken": {"kind": "debuff", "duration": 2, "stacking": "refresh", "stat": "attack",  "multiplier": 0.75}
+}
+
+class StatusEffect:
+    def __init__(self, name, data, target, expires_at):
+        self.name       = name
+        self.data       = data
+        self.target     = target
+        self.stacks     = 1
+        self.expires_at = expires_at  # Round on which the effect wears off
+        self.version    = 0           # Bumped on reschedule so stale wheel entries are skipped
+
+    def ticks(self):
+        return "tick_damage" in self.data or "tick_heal" in self.data
+
+class TimingWheel:
+    """Hashed timing wheel keyed by round number.
+
+    Each slot only holds events due on rounds congruent to its index, so
+    advancing a round touches just the events scheduled for it instead of
+    every active effect in the battle.
+    """
+    def __init__(self, size=16):
+        self.size    = size
+        self.slots   = [[] for _ in range(size)]
+        self.current = 0
+
+    def schedule(self, round_no, event):
+        self.slots[round_no % self.size].append((round_no, event))
+
+    def advance(self):
+        """Move to the next round and return the events due on it."""
+        self.current += 1
+        index = self.current % self.size
+        slot = self.slots[index]
+        due = [event for round_no, event in slot if round_no == self.current]
+        if len(due) != len(slot):
+            self.slots[index] = [entry for entry in slot if entry[0] != self.current]
+        else:
+            self.slots[index] = []
+        return due
+
+class StatusEffectManager:
+    def __init__(self):
+        self.wheel = TimingWheel()
+
+    def apply(self, name, target):
+        """Apply (or stack/refresh) a status effect on target."""
+        if not target.alive:
+            return
+        data = status_effects_data[name]
+        expires_at = self.wheel.current + data["duration"]
+        effect = target.status_effects.get(name)
+        if effect is None:
+            effect = StatusEffect(name, data, target, expires_at)
+            target.status_effects[name] = effect
+            self._schedule(effect)
+            add_log_entry(f"{target.name} is affected by {name}!")
+        elif data["stacking"] == "ignore":
+            return
+        else:
+            if data["stacking"] == "stack":
+                effect.stacks = min(effect.stacks + 1, data.get("max_stacks", 1))
+            effect.expires_at = expires_at
+            # Ticking effects re-check expires_at every round; others need a new expiry event.
+            if not effect.ticks():
+                self._schedule(effect)
+            if effect.stacks > 1:
+                add_log_entry(f"{target.name}'s {name} grows to {effect.stacks} stacks!")
+            else:
+                add_log_entry(f"{target.name}'s {name} is refreshed!")
+        self._refresh_modifiers(target)
+
+    def remove(self, target, name):
+        if target.status_effects.pop(name, None) is not None:
+            self._refresh_modifiers(target)
+
+    def consume_stun(self, character):
+        """Remove any stunning effects from character; return True if it was stunned."""
+        if not character.stunned:
+            return False
+        for name in [name for name, effect in character.status_effects.items() if effect.data.get("stun")]:
+            self.remove(character, name)
+        return True
+
+    def advance_round(self):
+        """Advance to the next round, firing only the ticks and expiries due on it."""
+        for effect, version in self.wheel.advance():
+            if effect.version != version or effect.target.status_effects.get(effect.name) is not effect:
+                continue
+            self._fire(effect)
+
+    def _schedule(self, effect):
+        effect.version += 1
+        due = self.wheel.current + 1 if effect.ticks() else effect.expires_at
+        self.wheel.schedule(due, (effect, effect.version))
+
+    def _fire(self, effect):
+        target = effect.target
+        data = effect.data
+        if "tick_damage" in data:
+            dmg = data["tick_damage"] * effect.stacks
+            target.take_damage(dmg)
+            add_log_entry(f"{target.name} takes {dmg} damage from {effect.name}!")
+            if not target.alive:
+                return
+        if "tick_heal" in data:
+            amount = data["tick_heal"] * effect.stacks
+            target.heal(amount)
+            add_log_entry(f"{target.name} recovers {amount} HP from {effect.name}!")
+        if self.wheel.current >= effect.expires_at:
+            self.remove(target, effect.name)
+            add_log_entry(f"{target.name}'s {effect.name} wore off.")
+        else:
+            self._schedule(effect)
+
+    def _refresh_modifiers(self, character):
+        modifiers = {}
+        stunned = False
+        for effect in character.status_effects.values():
+            data = effect.data
+            if "stat" in data:
+                factor = 1 + (data["multiplier"] - 1) * effect.stacks
+                modifiers[data["stat"]] = modifiers.get(data["stat"], 1.0) * factor
+            if data.get("stun"):
+                stunned = True
+        character.stat_modifiers = modifiers
+        character.stunned = stunned
 
 # ---------------------------
 # Animation Classes – Bespoke for Each Action
@@ -232,8 +404,8 @@ class BaseAnimation:
 
 # --- Warrior Animations ---
 class WarriorStrikeAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 600)
+    def __init__(self, attacker, target, duration=600):
+        super().__init__(attacker, target, duration)
         self.start_pos = self.get_center(attacker)
         self.end_pos   = self.get_center(target)
 
@@ -251,8 +423,8 @@ class WarriorStrikeAnimation(BaseAnimation):
         pygame.draw.line(screen, RED, self.start_pos, (x, y), thickness)
 
 class WarriorHeavySlashAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 800)
+    def __init__(self, attacker, target, duration=800):
+        super().__init__(attacker, target, duration)
         self.start_pos = WarriorStrikeAnimation(attacker, target).get_center(attacker)
         self.end_pos   = WarriorStrikeAnimation(attacker, target).get_center(target)
 
@@ -269,8 +441,8 @@ class WarriorHeavySlashAnimation(BaseAnimation):
 
 # --- Mage Animations ---
 class MageMagicMissileAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 500)
+    def __init__(self, attacker, target, duration=500):
+        super().__init__(attacker, target, duration)
         self.start_pos = self.get_center(attacker)
         self.end_pos   = self.get_center(target)
 
@@ -287,8 +459,8 @@ class MageMagicMissileAnimation(BaseAnimation):
         pygame.draw.circle(screen, BLUE, (int(x), int(y)), 8)
 
 class MageFireballAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 700)
+    def __init__(self, attacker, target, duration=700):
+        super().__init__(attacker, target, duration)
         self.start_pos = MageMagicMissileAnimation(attacker, target).get_center(attacker)
         self.end_pos   = MageMagicMissileAnimation(attacker, target).get_center(target)
 
@@ -300,8 +472,8 @@ class MageFireballAnimation(BaseAnimation):
 
 # --- Healer Animations ---
 class HealerAttackAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 500)
+    def __init__(self, attacker, target, duration=500):
+        super().__init__(attacker, target, duration)
         self.start_pos = MageMagicMissileAnimation(attacker, target).get_center(attacker)
         self.end_pos   = MageMagicMissileAnimation(attacker, target).get_center(target)
 
@@ -312,8 +484,8 @@ class HealerAttackAnimation(BaseAnimation):
         pygame.draw.line(screen, LIGHT_GREEN, self.start_pos, (x, y), thickness)
 
 class HealerHealAnimation(BaseAnimation):
-    def __init__(self, target):
-        super().__init__(None, target, 800)
+    def __init__(self, attacker, target, duration=800):
+        super().__init__(attacker, target, duration)
         if target.sprite:
             self.center = (target.pos[0] + target.sprite.get_width()//2,
                            target.pos[1] + target.sprite.get_height()//2)
@@ -329,8 +501,8 @@ class HealerHealAnimation(BaseAnimation):
 
 # --- Thief Animations ---
 class ThiefQuickStrikeAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 400)
+    def __init__(self, attacker, target, duration=400):
+        super().__init__(attacker, target, duration)
         self.start_pos = MageMagicMissileAnimation(attacker, target).get_center(attacker)
         self.end_pos   = MageMagicMissileAnimation(attacker, target).get_center(target)
 
@@ -341,8 +513,8 @@ class ThiefQuickStrikeAnimation(BaseAnimation):
         pygame.draw.line(screen, YELLOW, self.start_pos, (x, y), thickness)
 
 class ThiefBackstabAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 600)
+    def __init__(self, attacker, target, duration=600):
+        super().__init__(attacker, target, duration)
         if target.sprite:
             self.center = (target.pos[0] + target.sprite.get_width()//2,
                            target.pos[1] + target.sprite.get_height()//2)
@@ -358,8 +530,8 @@ class ThiefBackstabAnimation(BaseAnimation):
 
 # --- Boss Animations ---
 class BossSmashAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 800)
+    def __init__(self, attacker, target, duration=800):
+        super().__init__(attacker, target, duration)
         if target.sprite:
             self.center = (target.pos[0] + target.sprite.get_width()//2,
                            target.pos[1] + target.sprite.get_height()//2)
@@ -374,8 +546,8 @@ class BossSmashAnimation(BaseAnimation):
         screen.blit(shock_surface, (self.center[0] - radius, self.center[1] - radius))
 
 class BossDarkBlastAnimation(BaseAnimation):
-    def __init__(self, attacker, target):
-        super().__init__(attacker, target, 700)
+    def __init__(self, attacker, target, duration=700):
+        super().__init__(attacker, target, duration)
         self.start_pos = MageMagicMissileAnimation(attacker, target).get_center(attacker)
         self.end_pos   = MageMagicMissileAnimation(attacker, target).get_center(target)
 
@@ -388,33 +560,124 @@ class BossDarkBlastAnimation(BaseAnimation):
         offset_y = int(15 * math.sin(angle))
         pygame.draw.circle(screen, (75, 0, 130), (int(x + offset_x), int(y + offset_y)), radius)
 
+# Every one of these characters must have at least one move in the moves file.
+PARTY_NAMES = tuple(cls().name for cls in (Warrior, Mage, Healer, Thief))
+BOSS_NAME   = Boss().name
+
+# Animation classes that move definitions may reference by name.
+ANIMATION_CLASSES = {cls.__name__: cls for cls in (
+    BaseAnimation,
+    WarriorStrikeAnimation, WarriorHeavySlashAnimation,
+    MageMagicMissileAnimation, MageFireballAnimation,
+    HealerAttackAnimation, HealerHealAnimation,
+    ThiefQuickStrikeAnimation, ThiefBackstabAnimation,
+    BossSmashAnimation, BossDarkBlastAnimation,
+)}
+
+class MoveRegistry:
+    """Loads move definitions from a JSON file and compiles them into Move objects.
+
+    Moves get integer IDs that stay the same across reloads, and animations are
+    dispatched through a table indexed by move ID.
+    """
+    def __init__(self, path):
+        self.path       = path
+        self.ids        = {}   # (owner, move name) -> move ID
+        self.moves      = []   # Move objects indexed by ID (None once removed from the file)
+        self.animations = []   # (animation class, duration) indexed by move ID
+        self.by_owner   = {}   # character name -> tuple of Move objects in menu order
+        self.mtime      = None
+        self.next_poll  = 0
+        self.load()
+
+    def load(self):
+        """(Re)compile the moves file. Raises ValueError if it is invalid."""
+        mtime = os.stat(self.path).st_mtime
+        with open(self.path) as f:
+            try:
+                raw = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{os.path.basename(self.path)}: {e}") from e
+        if not isinstance(raw, dict):
+            raise ValueError(f"{os.path.basename(self.path)}: top level must be an object of character names")
+        ids = dict(self.ids)
+        by_owner = {}
+        for owner, entries in raw.items():
+            if owner not in PARTY_NAMES and owner != BOSS_NAME:
+                raise ValueError(f"{owner}: not a character name")
+            if not isinstance(entries, list) or not all(isinstance(data, dict) for data in entries):
+                raise ValueError(f"{owner}: moves must be a list of objects")
+            compiled = []
+            for data in entries:
+                key = (owner, data["name"])
+                if any(move.name == data["name"] for move in compiled):
+                    raise ValueError(f"{owner}/{data['name']}: duplicate move name")
+                for field in MOVE_NUMBER_FIELDS:
+                    if field in data and not math.isfinite(float(data[field])):
+                        raise ValueError(f"{owner}/{data['name']}: {field} must be a finite number")
+                if key not in ids:
+                    ids[key] = len(ids)
+                move = Move(ids[key], owner, data)
+                if move.type not in MOVE_TYPES:
+                    raise ValueError(f"{owner}/{move.name}: unknown move type {move.type!r}")
+                if move.effect is not None and move.effect not in status_effects_data:
+                    raise ValueError(f"{owner}/{move.name}: unknown status effect {move.effect!r}")
+                if move.animation is not None and move.animation not in ANIMATION_CLASSES:
+                    raise ValueError(f"{owner}/{move.name}: unknown animation {move.animation!r}")
+                if move.duration <= 0:
+                    raise ValueError(f"{owner}/{move.name}: duration must be positive")
+                if not 0 <= move.hit_chance <= 1 or not 0 <= move.effect_chance <= 1:
+                    raise ValueError(f"{owner}/{move.name}: hit_chance and effect_chance must be between 0 and 1")
+                if move.multiplier < 0:
+                    raise ValueError(f"{owner}/{move.name}: multiplier must not be negative")
+                if owner == BOSS_NAME and move.is_heal:
+                    raise ValueError(f"{owner}/{move.name}: the boss cannot use heal moves")
+                compiled.append(move)
+            by_owner[owner] = tuple(compiled)
+        for owner in PARTY_NAMES + (BOSS_NAME,):
+            if not by_owner.get(owner):
+                raise ValueError(f"{owner}: needs at least one move")
+
+        moves = [None] * len(ids)
+        animations = [(BaseAnimation, 500)] * len(ids)
+        for compiled in by_owner.values():
+            for move in compiled:
+                moves[move.id] = move
+                animations[move.id] = (ANIMATION_CLASSES[move.animation or "BaseAnimation"], move.duration)
+        self.ids, self.moves, self.animations, self.by_owner = ids, moves, animations, by_owner
+        self.mtime = mtime
+
+    def poll(self, current_time):
+        """Reload the moves file if it changed on disk. Returns True if it was reloaded."""
+        if current_time < self.next_poll:
+            return False
+        self.next_poll = current_time + MOVES_POLL_INTERVAL
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return False  # The file can briefly vanish while an editor saves it.
+        if mtime == self.mtime:
+            return False
+        try:
+            self.load()
+        except (OSError, KeyError, TypeError, ValueError, ArithmeticError) as e:
+            # Keep playing with the previous definitions until the file is fixed.
+            self.mtime = mtime
+            add_log_entry(f"Move reload failed: {e}")
+            return False
+        add_log_entry("Moves reloaded.")
+        return True
+
+    def moves_for(self, owner):
+        return self.by_owner.get(owner, ())
+
+move_registry = MoveRegistry(MOVES_FILE)
+
 def create_animation(action):
-    if action.attacker.name == "Warrior":
-        if action.move_name == "Strike":
-            return WarriorStrikeAnimation(action.attacker, action.target)
-        elif action.move_name == "Heavy Slash":
-            return WarriorHeavySlashAnimation(action.attacker, action.target)
-    elif action.attacker.name == "Mage":
-        if action.move_name == "Magic Missile":
-            return MageMagicMissileAnimation(action.attacker, action.target)
-        elif action.move_name == "Fireball":
-            return MageFireballAnimation(action.attacker, action.target)
-    elif action.attacker.name == "Healer":
-        if action.move_name == "Attack":
-            return HealerAttackAnimation(action.attacker, action.target)
-        elif action.move_name == "Heal":
-            return HealerHealAnimation(action.target)
-    elif action.attacker.name == "Thief":
-        if action.move_name == "Quick Strike":
-            return ThiefQuickStrikeAnimation(action.attacker, action.target)
-        elif action.move_name == "Backstab":
-            return ThiefBackstabAnimation(action.attacker, action.target)
-    elif action.attacker.name == "Final Boss":
-        if action.move_name == "Smash":
-            return BossSmashAnimation(action.attacker, action.target)
-        elif action.move_name == "Dark Blast":
-            return BossDarkBlastAnimation(action.attacker, action.target)
-    return BaseAnimation(action.attacker, action.target, 500)
+    if action.move_id is None:
+        return BaseAnimation(action.attacker, action.target, 500)
+    animation_cls, duration = move_registry.animations[action.move_id]
+    return animation_cls(action.attacker, action.target, duration)
 
 # ---------------------------
 # Utility Functions for UI & Art
@@ -447,6 +710,17 @@ def draw_health(screen, character):
     ratio = character.hp / character.max_hp if character.max_hp > 0 else 0
     pygame.draw.rect(screen, GREEN, (x, y - 15, int(bar_width * ratio), bar_height))
 
+def draw_status_effects(screen, character):
+    """List a character's active status effects to the right of its sprite."""
+    sprite_width = character.sprite.get_width() if character.sprite else 80
+    x, y = character.pos
+    font = pygame.font.SysFont("Arial", 14)
+    for i, effect in enumerate(character.status_effects.values()):
+        text = effect.name if effect.stacks == 1 else f"{effect.name} x{effect.stacks}"
+        color = LIGHT_GREEN if effect.data["kind"] == "buff" else ORANGE
+        label = font.render(text, True, color)
+        screen.blit(label, (x + sprite_width + 5, y + i * 16))
+
 def draw_turn_order(screen, turn_queue):
     font = pygame.font.SysFont("Arial", 20)
     order_names = " -> ".join([actor.name for actor in turn_queue if actor.alive])
@@ -482,7 +756,7 @@ def recalc_turn_queue(party, boss):
     if boss.alive:
         actors.append(boss)
     actors.extend([member for member in party if member.alive])
-    actors.sort(key=lambda c: c.speed, reverse=True)
+    actors.sort(key=lambda c: c.get_stat("speed"), reverse=True)
     return actors
 
 # ---------------------------
@@ -497,6 +771,8 @@ pending_action     = None
 selected_menu_index= 0
 current_menu_options  = []  # For the action selection menu
 current_prompt         = ""
+status_manager         = None
+current_moves          = ()  # Moves behind current_menu_options during STATE_PLAYER_CHOICE
 action_log = []  # Global gamelog (list of strings)
 
 def add_log_entry(text):
@@ -512,6 +788,7 @@ def main():
     global game_state, turn_queue, turn_index, current_actor
     global current_animation, pending_action, selected_menu_index
     global current_menu_options, current_prompt
+    global status_manager, current_moves
 
     # Create characters.
     party = [Warrior(), Mage(), Healer(), Thief()]
@@ -525,6 +802,7 @@ def main():
     boss.sprite     = generate_boss_sprite((120, 120))
 
     assign_positions(party, boss)
+    status_manager = StatusEffectManager()
     turn_queue = recalc_turn_queue(party, boss)
     turn_index = 0
     current_actor = turn_queue[turn_index] if turn_queue else None
@@ -533,6 +811,11 @@ def main():
     running = True
     while running:
         current_time = pygame.time.get_ticks()
+        if move_registry.poll(current_time) and game_state == STATE_PLAYER_CHOICE:
+            # Show the reloaded moves for the character currently choosing.
+            current_moves = move_registry.moves_for(current_actor.name)
+            current_menu_options = [move.name for move in current_moves]
+            selected_menu_index = min(selected_menu_index, max(0, len(current_menu_options) - 1))
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -560,8 +843,8 @@ def main():
                         selected_menu_index = (selected_menu_index + 1) % len(current_menu_options)
                     elif event.key == pygame.K_RETURN:
                         if game_state == STATE_PLAYER_CHOICE:
-                            move = moves_data[current_actor.name][selected_menu_index]
-                            if move["type"] == "heal":
+                            move = current_moves[selected_menu_index]
+                            if move.is_heal:
                                 alive_party = [member for member in party if member.alive]
                                 current_menu_options = [f"{member.name} ({member.hp}/{member.max_hp})" for member in alive_party]
                                 if not current_menu_options:
@@ -571,17 +854,19 @@ def main():
                                 pending_action = {"move": move}
                                 game_state = STATE_TARGET_SELECTION
                             else:
-                                hit = random.random() <= move["hit_chance"]
-                                dmg = calculate_damage(current_actor, boss, move["multiplier"], is_magic=(move["type"]=="magical"))
-                                pending_action = Action(current_actor, boss, move["name"], dmg, move["type"], is_heal=False, hit=hit)
+                                hit = random.random() <= move.hit_chance
+                                dmg = calculate_damage(current_actor, boss, move.multiplier, is_magic=move.is_magic)
+                                pending_action = Action(current_actor, boss, move.name, dmg, move.type, is_heal=False, hit=hit,
+                                                        effect=roll_effect(move), move_id=move.id)
                                 current_animation = create_animation(pending_action)
                                 game_state = STATE_ANIMATION
                         elif game_state == STATE_TARGET_SELECTION:
                             alive_party = [member for member in party if member.alive]
                             target = alive_party[selected_menu_index] if alive_party else current_actor
                             move = pending_action["move"]
-                            dmg = int(current_actor.magic * move["multiplier"] * random.uniform(0.85, 1.15))
-                            pending_action = Action(current_actor, target, move["name"], dmg, "heal", is_heal=True)
+                            dmg = int(current_actor.get_stat("magic") * move.multiplier * random.uniform(0.85, 1.15))
+                            pending_action = Action(current_actor, target, move.name, dmg, "heal", is_heal=True,
+                                                    effect=roll_effect(move), move_id=move.id)
                             current_animation = create_animation(pending_action)
                             game_state = STATE_ANIMATION
 
@@ -623,35 +908,49 @@ def main():
                         add_log_entry(f"{pending_action.attacker.name} uses {pending_action.move_name} on {pending_action.target.name}, dealing {pending_action.damage} damage!")
                 else:
                     add_log_entry(f"{pending_action.attacker.name} used {pending_action.move_name} on {pending_action.target.name} but missed!")
+                if pending_action.hit and pending_action.effect:
+                    if status_effects_data[pending_action.effect].get("target") == "self":
+                        status_manager.apply(pending_action.effect, pending_action.attacker)
+                    else:
+                        status_manager.apply(pending_action.effect, pending_action.target)
                 current_animation = None
                 pending_action = None
                 game_state = STATE_NEXT_TURN
 
         # State transitions.
         if game_state == STATE_TURN_START:
+            if boss.alive and any(member.alive for member in party):
+                # The queue is fixed for the round; skip actors who died since it was built.
+                while turn_index < len(turn_queue) and not turn_queue[turn_index].alive:
+                    turn_index += 1
+                if turn_index >= len(turn_queue):
+                    # A new round begins: fire the status-effect ticks and expiries due now,
+                    # then re-sort so speed changes take effect from this round on.
+                    turn_index = 0
+                    status_manager.advance_round()
+                    turn_queue = recalc_turn_queue(party, boss)
             if not boss.alive:
                 game_state = STATE_VICTORY
             elif not any(member.alive for member in party):
                 game_state = STATE_GAME_OVER
             else:
-                turn_queue = recalc_turn_queue(party, boss)
-                if turn_index >= len(turn_queue):
-                    turn_index = 0
                 current_actor = turn_queue[turn_index]
-                if current_actor in party:
-                    current_menu_options = [move["name"] for move in moves_data[current_actor.name]]
+                if status_manager.consume_stun(current_actor):
+                    add_log_entry(f"{current_actor.name} is stunned and loses the turn!")
+                    game_state = STATE_NEXT_TURN
+                elif current_actor in party:
+                    current_moves = move_registry.moves_for(current_actor.name)
+                    current_menu_options = [move.name for move in current_moves]
                     selected_menu_index = 0
                     current_prompt = f"{current_actor.name}'s turn: Choose an action:"
                     game_state = STATE_PLAYER_CHOICE
                 else:
-                    boss_move = random.choice([
-                        {"name": "Smash",      "type": "physical", "multiplier": 1.2, "hit_chance": 1.0},
-                        {"name": "Dark Blast", "type": "magical",  "multiplier": 1.2, "hit_chance": 1.0}
-                    ])
-                    hit = random.random() <= boss_move["hit_chance"]
+                    boss_move = random.choice(move_registry.moves_for(boss.name))
+                    hit = random.random() <= boss_move.hit_chance
                     target = random.choice([member for member in party if member.alive])
-                    dmg = calculate_damage(boss, target, boss_move["multiplier"], is_magic=(boss_move["type"]=="magical"))
-                    pending_action = Action(boss, target, boss_move["name"], dmg, boss_move["type"], is_heal=False, hit=hit)
+                    dmg = calculate_damage(boss, target, boss_move.multiplier, is_magic=boss_move.is_magic)
+                    pending_action = Action(boss, target, boss_move.name, dmg, boss_move.type, is_heal=False, hit=hit,
+                                            effect=roll_effect(boss_move), move_id=boss_move.id)
                     current_animation = create_animation(pending_action)
                     game_state = STATE_ANIMATION
 
@@ -668,8 +967,9 @@ def main():
         draw_characters(screen, party, boss)
         for member in party:
             draw_health(screen, member)
+            draw_status_effects(screen, member)
         draw_health(screen, boss)
-        turn_queue = recalc_turn_queue(party, boss)
+        draw_status_effects(screen, boss)
         draw_turn_order(screen, turn_queue)
 
         if game_state == STATE_ANIMATION and current_animation: